@@ -5,6 +5,16 @@ import json
 import re
 import subprocess
 import platform
+import threading
+import queue
+import struct
+import time
+import bisect
+import shutil
+import shlex
+import argparse
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from send2trash import send2trash
@@ -14,6 +24,641 @@ except ImportError:
 # Config file path
 CONFIG_FILE = "./config.json"
 
+# How often (ms) the UI checks the background file worker for finished jobs
+JOB_POLL_MS = 100
+
+# How often (ms) the folder is rescanned for new clips
+WATCH_INTERVAL_MS = 3000
+
+# "Game YYYY.MM.DD - <index or raw DVR part>[-tag1-tag2...]" (extension stripped)
+CLIP_NAME_PATTERN = re.compile(r"^(.+) (\d{4}\.\d{2}\.\d{2}) - (\d+|.*DVR)((?:-[^-]+)*)$", re.IGNORECASE)
+
+# Trimmed copy saved by an external player, waiting for "Replace Trimmed" (group 1: original name)
+TRIM_PATTERN = re.compile(r"(.+?)(?:[\s_-]+Trim)\.mp4$", re.IGNORECASE)
+
+
+def read_mp4_duration(path):
+    """Read the clip length in seconds from the mp4 'mvhd' box (None if unreadable)"""
+    try:
+        with open(path, 'rb') as f:
+            end = os.fstat(f.fileno()).st_size
+            pos = 0
+            while pos + 8 <= end:
+                f.seek(pos)
+                size, box_type = struct.unpack(">I4s", f.read(8))
+                header = 8
+                if size == 1:
+                    size = struct.unpack(">Q", f.read(8))[0]
+                    header = 16
+                elif size == 0:
+                    size = end - pos
+                if size < header:
+                    return None
+
+                if box_type == b'moov':
+                    # Descend into the movie box; mvhd is one of its children
+                    end = pos + size
+                    pos += header
+                    continue
+                if box_type == b'mvhd':
+                    version = f.read(4)[0]
+                    if version == 1:
+                        timescale, duration = struct.unpack(">16xIQ", f.read(28))
+                    else:
+                        timescale, duration = struct.unpack(">8xII", f.read(16))
+                    return duration / timescale if timescale else None
+                pos += size
+    except (OSError, struct.error, IndexError):
+        pass
+    return None
+
+
+class ClipInfo:
+    """Cached metadata for one clip: stat info plus what the filename encodes"""
+
+    def __init__(self, folder, name, size, mtime):
+        self.folder = folder
+        self.name = name
+        self.size = size
+        self.mtime = mtime
+        self._duration = None
+        self._duration_read = False
+
+        base, self.ext = os.path.splitext(name)
+        # Trim copies are not clips of their own; parsing them would turn "Trim" into a tag
+        self.is_trim = TRIM_PATTERN.match(name) is not None
+        match = None if self.is_trim else CLIP_NAME_PATTERN.match(base)
+        if match:
+            self.game, self.date, self.core = match.group(1), match.group(2), match.group(3)
+            self.tags = [t for t in match.group(4).split('-') if t]
+            self.kind = "formatted" if self.core.isdigit() else "raw"
+        else:
+            self.game = self.date = self.core = None
+            self.tags = []
+            self.kind = "other"
+
+    @property
+    def path(self):
+        return os.path.join(self.folder, self.name)
+
+    @property
+    def duration(self):
+        """Clip length in seconds, read from the file on first access"""
+        if not self._duration_read:
+            self._duration = read_mp4_duration(self.path)
+            self._duration_read = True
+        return self._duration
+
+    def name_with_tags(self, tags, core=None):
+        """Filename for this clip carrying the given tag suffix (and optionally a new index)"""
+        suffix = "".join(f"-{t}" for t in tags)
+        return f"{self.game} {self.date} - {core or self.core}{suffix}{self.ext}"
+
+
+class FolderIndex:
+    """Stat cache for the .mp4 files of one folder. scan() reports only what changed.
+
+    Listeners (objects with clip_added/clip_removed) are told about every change,
+    so views built on top of the index can update incrementally.
+    """
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.clips = {}  # {filename: ClipInfo}
+        self.listeners = []
+
+    def scan(self):
+        """Rescan the folder; returns (added, changed, removed) lists of ClipInfo"""
+        return self.apply_listing(self.list_folder(self.folder))
+
+    @staticmethod
+    def list_folder(folder):
+        """{filename: (size, mtime)} for the folder's .mp4 files. Only does the I/O,
+        so it can run on a worker thread and be handed to apply_listing() later."""
+        listing = {}
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if not entry.name.lower().endswith('.mp4') or not entry.is_file():
+                    continue
+                st = entry.stat()
+                listing[entry.name] = (st.st_size, st.st_mtime)
+        return listing
+
+    def apply_listing(self, listing):
+        """Update the cache from a list_folder() result; returns (added, changed, removed)"""
+        seen = {}
+        added, changed = [], []
+        for name, (size, mtime) in listing.items():
+            old = self.clips.get(name)
+            if old and old.size == size and old.mtime == mtime:
+                seen[name] = old
+                continue
+            clip = ClipInfo(self.folder, name, size, mtime)
+            seen[name] = clip
+            (changed if old else added).append(clip)
+
+        removed = [clip for name, clip in self.clips.items() if name not in seen]
+        for clip in changed:
+            self.notify_removed(self.clips[clip.name])
+        for clip in removed:
+            self.notify_removed(clip)
+        for clip in added + changed:
+            self.notify_added(clip)
+
+        self.clips = seen
+        return added, changed, removed
+
+    def rename(self, old_name, new_name):
+        """Record a rename made by the app itself so it is not reported as new"""
+        old = self.clips.pop(old_name, None)
+        if old:
+            clip = ClipInfo(self.folder, new_name, old.size, old.mtime)
+            self.clips[new_name] = clip
+            self.notify_removed(old)
+            self.notify_added(clip)
+
+    def notify_added(self, clip):
+        for listener in self.listeners:
+            listener.clip_added(clip)
+
+    def notify_removed(self, clip):
+        for listener in self.listeners:
+            listener.clip_removed(clip)
+
+
+class Session:
+    """A run of clips of one game with no capture gap longer than the session gap"""
+
+    def __init__(self, game, clips):
+        self.game = game
+        self.clips = clips  # Oldest first
+
+    @property
+    def key(self):
+        """Stable identity used to remember collapsed groups across refreshes"""
+        return (self.game, int(self.clips[0].mtime))
+
+    @property
+    def start(self):
+        return self.clips[0].mtime
+
+    @property
+    def end(self):
+        return self.clips[-1].mtime
+
+    def label(self):
+        start = time.strftime("%Y.%m.%d %H:%M", time.localtime(self.start))
+        end = time.strftime("%H:%M", time.localtime(self.end))
+        count = len(self.clips)
+        return f"{self.game}  {start} – {end}  ({count} clip{'s' if count != 1 else ''})"
+
+
+def cluster_sessions(game, clips, gap_seconds):
+    """Split clips (sorted by mtime) wherever the gap between neighbours exceeds gap_seconds"""
+    sessions = []
+    current = []
+    for clip in clips:
+        if current and clip.mtime - current[-1].mtime > gap_seconds:
+            sessions.append(Session(game, current))
+            current = []
+        current.append(clip)
+    if current:
+        sessions.append(Session(game, current))
+    return sessions
+
+
+class SessionIndex:
+    """Sessions per game, kept up to date as a FolderIndex listener.
+
+    Clips are kept sorted per game; only games that changed since the last
+    call to sessions() are re-clustered.
+    """
+
+    def __init__(self, gap_seconds):
+        self.gap_seconds = gap_seconds
+        self.entries = {}   # {game: [(mtime, name, ClipInfo), ...]} sorted
+        self.clustered = {} # {game: [Session, ...]}
+        self.dirty = set()
+
+    def clip_added(self, clip):
+        if clip.kind == "other":
+            return
+        bisect.insort(self.entries.setdefault(clip.game, []), (clip.mtime, clip.name, clip))
+        self.dirty.add(clip.game)
+
+    def clip_removed(self, clip):
+        entries = self.entries.get(clip.game)
+        if not entries:
+            return
+        i = bisect.bisect_left(entries, (clip.mtime, clip.name))
+        if i < len(entries) and entries[i][1] == clip.name:
+            del entries[i]
+            self.dirty.add(clip.game)
+
+    def sessions(self):
+        """All sessions, newest first"""
+        for game in self.dirty:
+            clips = [entry[2] for entry in self.entries.get(game, [])]
+            self.clustered[game] = cluster_sessions(game, clips, self.gap_seconds)
+        self.dirty.clear()
+
+        result = [s for sessions in self.clustered.values() for s in sessions]
+        result.sort(key=lambda s: s.end, reverse=True)
+        return result
+
+
+class TagRule:
+    """One compiled auto-tag rule. Every condition given in the spec must hold."""
+
+    def __init__(self, spec, tag_data):
+        if not isinstance(spec, dict):
+            raise ValueError(f"Rule must be an object, got: {spec!r}")
+        self.name = spec.get('name') or ", ".join(spec.get('tags') or [])
+        self.game = spec.get('game')
+        self.tags = spec.get('tags')
+
+        if not self.tags or not isinstance(self.tags, list):
+            raise ValueError(f"Rule '{self.name}' needs a non-empty 'tags' list")
+        if self.game:
+            if self.game not in tag_data:
+                raise ValueError(f"Rule '{self.name}': unknown game '{self.game}'")
+            unknown = [t for t in self.tags if t not in tag_data[self.game]]
+            if unknown:
+                raise ValueError(f"Rule '{self.name}': tags not defined for {self.game}: {', '.join(unknown)}")
+
+        # Rules without a game only add tags that the clip's own game (or General) defines
+        self.allowed_tags = {game: set(tags) | set(tag_data.get("General", [])) for game, tags in tag_data.items()}
+
+        hours = spec.get('hours')
+        if hours is not None and (not isinstance(hours, list) or len(hours) != 2
+                                  or not all(type(h) is int and 0 <= h <= 23 for h in hours)):
+            raise ValueError(f"Rule '{self.name}': 'hours' must be [start, end] with whole hours 0-23")
+        self.hours = hours
+
+        try:
+            self.min_duration = float(spec['min_duration']) if spec.get('min_duration') is not None else None
+            self.max_duration = float(spec['max_duration']) if spec.get('max_duration') is not None else None
+            self.min_size = float(spec['min_size_mb']) * 1024 * 1024 if spec.get('min_size_mb') is not None else None
+            self.max_size = float(spec['max_size_mb']) * 1024 * 1024 if spec.get('max_size_mb') is not None else None
+        except (TypeError, ValueError):
+            raise ValueError(f"Rule '{self.name}': duration and size limits must be numbers")
+        self.needs_duration = self.min_duration is not None or self.max_duration is not None
+
+    def matches(self, clip):
+        # Cheap checks first; duration needs a file read
+        if self.game and clip.game != self.game:
+            return False
+        if self.min_size is not None and clip.size < self.min_size:
+            return False
+        if self.max_size is not None and clip.size > self.max_size:
+            return False
+        if self.hours is not None:
+            start, end = self.hours
+            hour = time.localtime(clip.mtime).tm_hour
+            # Ranges like [22, 3] wrap past midnight
+            if start <= end:
+                if not start <= hour <= end:
+                    return False
+            elif end < hour < start:
+                return False
+        if self.min_duration is not None or self.max_duration is not None:
+            duration = clip.duration
+            if duration is None:
+                return False
+            if self.min_duration is not None and duration < self.min_duration:
+                return False
+            if self.max_duration is not None and duration > self.max_duration:
+                return False
+        return True
+
+    def tags_for(self, clip):
+        if self.game:
+            return self.tags
+        allowed = self.allowed_tags.get(clip.game, ())
+        return [t for t in self.tags if t in allowed]
+
+
+def compile_tag_rules(specs, tag_data):
+    """Validate rule specs from the config and compile them (raises ValueError)"""
+    if not isinstance(specs, list):
+        raise ValueError("Rules must be a JSON list")
+    return [TagRule(spec, tag_data) for spec in specs]
+
+
+def plan_auto_tags(clips, rules):
+    """Stream over clips and yield (clip, new_name) for each clip the rules add tags to"""
+    if not rules:
+        return
+    for clip in clips:
+        if clip.kind == "other":
+            continue
+        tags = list(clip.tags)
+        for rule in rules:
+            if rule.matches(clip):
+                for tag in rule.tags_for(clip):
+                    if tag not in tags:
+                        tags.append(tag)
+        if len(tags) != len(clip.tags):
+            yield clip, clip.name_with_tags(tags)
+
+
+def format_bytes(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+class FolderStats:
+    """Clip counts and bytes per game, date, tag and format status.
+
+    Registered as a FolderIndex listener, so the totals follow every rescan
+    without walking the whole folder again.
+    """
+
+    STATUS_LABELS = {"formatted": "Formatted", "raw": "Raw DVR (not formatted)", "other": "Other names"}
+
+    def __init__(self):
+        self.total = [0, 0]      # [clips, bytes]
+        self.untagged = [0, 0]
+        self.by_game = {}        # {game: [clips, bytes]}
+        self.by_date = {}
+        self.by_tag = {}
+        self.by_status = {}
+
+    def clip_added(self, clip):
+        self.apply(clip, 1)
+
+    def clip_removed(self, clip):
+        self.apply(clip, -1)
+
+    def apply(self, clip, sign):
+        def bump(entry):
+            entry[0] += sign
+            entry[1] += sign * clip.size
+
+        def bump_key(table, key):
+            entry = table.setdefault(key, [0, 0])
+            bump(entry)
+            if entry[0] == 0:
+                del table[key]
+
+        bump(self.total)
+        bump_key(self.by_status, clip.kind)
+        if clip.game:
+            bump_key(self.by_game, clip.game)
+            bump_key(self.by_date, clip.date)
+        for tag in clip.tags:
+            bump_key(self.by_tag, tag)
+        if not clip.tags:
+            bump(self.untagged)
+
+    def sections(self):
+        """[(title, [(name, clips, bytes), ...]), ...] with the biggest entries first"""
+        def rows(table, labels=None):
+            items = [((labels or {}).get(key, key), count, size) for key, (count, size) in table.items()]
+            return sorted(items, key=lambda item: item[2], reverse=True)
+
+        return [
+            ("Games", rows(self.by_game)),
+            ("Dates", sorted(rows(self.by_date), key=lambda item: item[0], reverse=True)),
+            ("Tags", rows(self.by_tag)),
+            ("Format status", rows(self.by_status, self.STATUS_LABELS)),
+        ]
+
+    def summary(self):
+        return (f"{self.total[0]} clips, {format_bytes(self.total[1])}  ·  "
+                f"untagged: {self.untagged[0]} ({format_bytes(self.untagged[1])})  ·  "
+                f"raw DVR: {self.by_status.get('raw', [0, 0])[0]}")
+
+    def report(self):
+        """Plain-text report for headless use"""
+        lines = [self.summary()]
+        for title, rows in self.sections():
+            lines.append("")
+            lines.append(title)
+            for name, count, size in rows:
+                lines.append(f"  {name:<32} {count:>6} clips {format_bytes(size):>10}")
+        return "\n".join(lines)
+
+    def as_dict(self):
+        return {
+            "clips": self.total[0],
+            "bytes": self.total[1],
+            "untagged": {"clips": self.untagged[0], "bytes": self.untagged[1]},
+            "games": {k: {"clips": c, "bytes": b} for k, (c, b) in self.by_game.items()},
+            "dates": {k: {"clips": c, "bytes": b} for k, (c, b) in self.by_date.items()},
+            "tags": {k: {"clips": c, "bytes": b} for k, (c, b) in self.by_tag.items()},
+            "status": {k: {"clips": c, "bytes": b} for k, (c, b) in self.by_status.items()},
+        }
+
+
+class RetentionRule:
+    """One retention policy. The first rule matching a clip decides what happens to it.
+
+    Matching: "game", "tags" (clip has any of them), "untagged": true. Only clips with a
+    "Game YYYY.MM.DD - ..." name are considered unless "include_other": true, so manual
+    exports are left alone. Pending "... Trim.mp4" copies never match any rule.
+    Actions: "keep": true, or "archive_after_days" / "trash_after_days" (clip age by mtime).
+    """
+
+    def __init__(self, spec):
+        if not isinstance(spec, dict):
+            raise ValueError(f"Rule must be an object, got: {spec!r}")
+        self.name = spec.get('name') or json.dumps(spec, ensure_ascii=False)
+        self.game = spec.get('game')
+        self.tags = spec.get('tags')
+        self.untagged = bool(spec.get('untagged', False))
+        self.include_other = bool(spec.get('include_other', False))
+        self.keep = bool(spec.get('keep', False))
+
+        if self.tags is not None and not isinstance(self.tags, list):
+            raise ValueError(f"Rule '{self.name}': 'tags' must be a list")
+        try:
+            self.archive_after = float(spec['archive_after_days']) if spec.get('archive_after_days') is not None else None
+            self.trash_after = float(spec['trash_after_days']) if spec.get('trash_after_days') is not None else None
+        except (TypeError, ValueError):
+            raise ValueError(f"Rule '{self.name}': day limits must be numbers")
+        if not self.keep and self.archive_after is None and self.trash_after is None:
+            raise ValueError(f"Rule '{self.name}' needs 'keep', 'archive_after_days' or 'trash_after_days'")
+
+    def matches(self, clip):
+        if clip.is_trim:
+            return False
+        if clip.kind == "other" and not self.include_other:
+            return False
+        if self.game and clip.game != self.game:
+            return False
+        if self.tags and not any(tag in clip.tags for tag in self.tags):
+            return False
+        if self.untagged and clip.tags:
+            return False
+        return True
+
+    def action(self, clip, now, archived):
+        """'archive', 'trash' or None (keep) for a clip this rule matches"""
+        if self.keep:
+            return None
+        age_days = (now - clip.mtime) / 86400
+        if self.trash_after is not None and age_days >= self.trash_after:
+            return "trash"
+        if not archived and self.archive_after is not None and age_days >= self.archive_after:
+            return "archive"
+        return None
+
+
+def compile_retention_rules(specs):
+    """Validate retention specs from the config (raises ValueError)"""
+    if not isinstance(specs, list):
+        raise ValueError("Retention rules must be a JSON list")
+    return [RetentionRule(spec) for spec in specs]
+
+
+def plan_retention(clips, rules, now, archived=False):
+    """Return [(clip, action)] for clips that should be archived or trashed.
+
+    archived: the clips are already in the archive folder, so only trashing applies.
+    """
+    plan = []
+    for clip in clips:
+        for rule in rules:
+            if rule.matches(clip):
+                action = rule.action(clip, now, archived)
+                if action:
+                    plan.append((clip, action))
+                break
+    return plan
+
+
+class Throttle:
+    """Shared bytes-per-second budget for parallel workers (0 = unlimited)"""
+
+    def __init__(self, bytes_per_second):
+        self.rate = bytes_per_second
+        self.lock = threading.Lock()
+        self.next_free = time.monotonic()
+
+    def wait(self, nbytes):
+        if not self.rate:
+            return
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_free)
+            self.next_free = start + nbytes / self.rate
+        if start > now:
+            time.sleep(start - now)
+
+
+def move_file(src, target_folder, throttle, chunk_size=1024 * 1024):
+    """Move src into target_folder.
+
+    Across drives the data is copied in chunks, each waiting for the throttle, into
+    a temporary name that is only renamed to the clip once the copy is complete.
+    """
+    dest = os.path.join(target_folder, os.path.basename(src))
+    if os.path.exists(dest):
+        raise FileExistsError(f"'{dest}' already exists")
+    if os.stat(src).st_dev == os.stat(target_folder).st_dev:
+        os.rename(src, dest)  # Same drive: nothing to copy
+        return
+
+    partial = dest + ".partial"
+    try:
+        with open(src, 'rb') as fsrc, open(partial, 'wb') as fdst:
+            while True:
+                chunk = fsrc.read(chunk_size)
+                if not chunk:
+                    break
+                throttle.wait(len(chunk))
+                fdst.write(chunk)
+        shutil.copystat(src, partial)
+        os.replace(partial, dest)
+    except BaseException:
+        try:
+            os.remove(partial)
+        except OSError:
+            pass
+        raise
+    os.remove(src)
+
+
+class PlayerManager:
+    """Starts the video player without waiting for it and keeps track of its processes.
+
+    command: optional player command line (list or string). "{file}" is replaced by
+        the clip and "{next}" by the clip below it in the list; if "{file}" is missing
+        the clip is appended.
+    enqueue_command: used instead of command while a player started by us is still
+        running, e.g. to hand the clip to that instance ("--playlist-enqueue").
+    Without a command the system's default player is used.
+    """
+
+    def __init__(self, command=None, enqueue_command=None):
+        self.command = command
+        self.enqueue_command = enqueue_command
+        self.processes = []
+
+    def reap(self):
+        """Forget players that have exited; returns the ones still running"""
+        self.processes = [proc for proc in self.processes if proc.poll() is None]
+        return self.processes
+
+    @staticmethod
+    def split_command(command):
+        """Command as an argument list; raises ValueError if it is not a string or list of strings"""
+        if isinstance(command, str):
+            if os.name == 'nt':
+                # Non-POSIX mode keeps backslashes in Windows paths, but also the quotes
+                # around tokens like "C:\Program Files\...\vlc.exe"; strip those
+                args = [arg[1:-1] if len(arg) >= 2 and arg[0] == arg[-1] == '"' else arg
+                        for arg in shlex.split(command, posix=False)]
+            else:
+                args = shlex.split(command)
+        elif isinstance(command, list) and all(isinstance(arg, str) for arg in command):
+            args = command
+        else:
+            raise ValueError(f"Player command must be a string or a list of strings, got: {command!r}")
+        if not args:
+            raise ValueError("Player command is empty")
+        return args
+
+    def build_args(self, command, filepath, next_path):
+        command = self.split_command(command)
+        args = []
+        for arg in command:
+            if "{next}" in arg:
+                # Nothing to queue after the last clip: drop the argument
+                if next_path:
+                    args.append(arg.replace("{next}", next_path))
+            else:
+                args.append(arg.replace("{file}", filepath))
+        if not any("{file}" in arg for arg in command):
+            args.append(filepath)
+        return args
+
+    def open(self, filepath, next_path=None):
+        """Launch or hand over the clip; returns immediately (raises OSError/ValueError on failure)"""
+        running = self.reap()
+        if self.enqueue_command and running:
+            args = self.build_args(self.enqueue_command, filepath, next_path)
+        elif self.command:
+            args = self.build_args(self.command, filepath, next_path)
+        elif platform.system() == 'Windows':
+            os.startfile(filepath)  # Already returns without waiting
+            return
+        elif platform.system() == 'Darwin':
+            args = ['open', filepath]
+        else:
+            args = ['xdg-open', filepath]
+
+        kwargs = {}
+        if os.name == 'posix':
+            kwargs['start_new_session'] = True  # Player survives the app closing
+        proc = subprocess.Popen(args, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL, close_fds=True, **kwargs)
+        self.processes.append(proc)
+
 class VideoManagerApp:
     def __init__(self, root):
         self.root = root
@@ -32,6 +677,7 @@ class VideoManagerApp:
         # Initialize data
         self.current_folder = ""
         self.video_files = []
+        self.list_rows = []          # One entry per listbox row: filename, or Session for group headers
         
         # --- NEW TAG DATA STRUCTURE ---
         # Dictionary: {"GameName": ["tag1", "tag2"], ...}
@@ -48,6 +694,47 @@ class VideoManagerApp:
         self.filtered_tags = []      # List of tags matching current search
         self.tab_cycle_index = -1    # Current index for Tab cycling
         
+        # Background file jobs (trash/delete/export/retention). Each lane has its own
+        # worker thread so a long retention run never delays user deletes. Workers never
+        # touch Tk; results come back through job_results and are handled by poll_file_jobs.
+        self.job_queues = {}         # {lane: queue.Queue}
+        self.job_workers = {}        # {lane: threading.Thread}
+        self.job_results = queue.Queue()
+        self.jobs_outstanding = 0
+        self.pending_files = set()   # Full paths queued for removal, hidden from the list
+        
+        # Auto-tag rules (raw specs from config, compiled lazily) and folder watching
+        self.tag_rules = []
+        self.compiled_tag_rules = None
+        self.auto_tag_on_ingest = False
+        self.folder_index = None
+        self.ingest_pending = {}     # {filename: (ClipInfo, first seen)} waiting for their size to settle
+        self.ingest_errors = []      # Rename failures from ingest, shown together in one dialog
+        self.watch_results = queue.Queue()
+        self.watch_busy = False      # A folder scan is running on the watch thread
+        self.auto_tag_results = queue.Queue()
+        self.auto_tag_busy = False   # A batch auto-tag pass is being planned on a worker thread
+        
+        # Retention policies and the archive folder they move clips to
+        self.retention_rules = []
+        self.archive_folder = ""
+        self.archive_workers = 2
+        self.archive_throttle_mb_per_s = 0  # 0 = unlimited
+        self.archive_index = None
+        
+        # Session grouping (clips split where the capture gap exceeds session_gap_minutes)
+        self.group_by_session = False
+        self.session_gap_minutes = 30
+        self.session_index = None
+        self.collapsed_sessions = set()
+        
+        # Folder statistics (kept up to date by the folder index) and their window
+        self.folder_stats = None
+        self.stats_window = None
+        
+        # Player launches (non-blocking; optional custom command from config)
+        self.player = PlayerManager()
+        
         # Load configuration
         self.load_config()
         
@@ -56,12 +743,15 @@ class VideoManagerApp:
         
         # --- Build UI ---
         self.create_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Auto-load previous folder
         if self.current_folder and os.path.exists(self.current_folder):
             self.refresh_file_list()
         else:
             self.current_folder = ""
+        
+        self.root.after(WATCH_INTERVAL_MS, self.watch_folder)
 
     def setup_styles(self):
         """Configure styles (Unified font: Arial)"""
@@ -136,6 +826,9 @@ class VideoManagerApp:
 
         self.create_header_btn(btn_bar, "📂 Select Folder", self.select_folder)
         self.create_header_btn(btn_bar, "🔄 Refresh", self.refresh_file_list)
+        self.create_header_btn(btn_bar, "🤖 Auto-Tag Rules", self.open_rules_editor)
+        self.create_header_btn(btn_bar, "📊 Stats", self.open_stats_window)
+        self.create_header_btn(btn_bar, "🗄️ Retention", self.open_retention_editor)
         
         # --- Main Container ---
         main_container = ttk.Frame(self.root, padding=15)
@@ -154,6 +847,9 @@ class VideoManagerApp:
         list_header.pack(fill=tk.X)
         ttk.Label(list_header, text="Video File List", font=self.font_large, style="Card.TLabel").pack(side=tk.LEFT)
         ttk.Label(list_header, text="(Date ▼, Index ▲)", foreground="gray", style="Card.TLabel").pack(side=tk.LEFT, padx=5)
+        
+        self.group_var = tk.BooleanVar(value=self.group_by_session)
+        ttk.Checkbutton(list_header, text="Group by session", variable=self.group_var, command=self.on_group_toggle).pack(side=tk.RIGHT)
 
         # Listbox Container
         list_frame = tk.Frame(left_panel, bg="white")
@@ -166,7 +862,7 @@ class VideoManagerApp:
             list_frame, 
             yscrollcommand=scrollbar.set, 
             font=self.font_mono,
-            selectmode=tk.SINGLE,
+            selectmode=tk.EXTENDED,
             bd=0,
             highlightthickness=0,
             activestyle='none',
@@ -179,7 +875,10 @@ class VideoManagerApp:
         
         # Event Bindings
         self.file_listbox.bind('<<ListboxSelect>>', self.on_file_select)
-        self.file_listbox.bind('<Double-1>', lambda event: self.open_video()) # Double click to open
+        self.file_listbox.bind('<Double-1>', self.on_list_double_click) # Double click to open / collapse
+        self.file_listbox.bind('<Button-3>', self.show_session_menu)
+        if platform.system() == 'Darwin':
+            self.file_listbox.bind('<Button-2>', self.show_session_menu)
 
         # --- BINDINGS FOR DELETION ---
         self.file_listbox.bind('<Delete>', self.delete_to_recycle_bin)
@@ -293,6 +992,31 @@ class VideoManagerApp:
                     # Ensure defaults exist if deleted
                     if "Valorant" not in self.tag_data: self.tag_data["Valorant"] = []
                     if "SoT" not in self.tag_data: self.tag_data["SoT"] = []
+                    
+                    self.tag_rules = data.get('tag_rules', [])
+                    self.auto_tag_on_ingest = data.get('auto_tag_on_ingest', False)
+                    self.group_by_session = data.get('group_by_session', False)
+                    self.session_gap_minutes = data.get('session_gap_minutes', 30)
+                    self.player.command = data.get('player_command')
+                    self.player.enqueue_command = data.get('player_enqueue_command')
+                    for key, command in (('player_command', self.player.command),
+                                         ('player_enqueue_command', self.player.enqueue_command)):
+                        if command is not None:
+                            try:
+                                PlayerManager.split_command(command)
+                            except ValueError as e:
+                                messagebox.showwarning("Config", f"Ignoring '{key}': {e}")
+                                setattr(self.player, key.replace('player_', ''), None)
+                    self.retention_rules = data.get('retention_rules', [])
+                    self.archive_folder = data.get('archive_folder', "")
+                    self.archive_workers = data.get('archive_workers', 2)
+                    self.archive_throttle_mb_per_s = data.get('archive_throttle_mb_per_s', 0)
+                    if type(self.archive_workers) is not int or self.archive_workers < 1:
+                        print(f"Invalid archive_workers {self.archive_workers!r}, using 2.")
+                        self.archive_workers = 2
+                    if type(self.archive_throttle_mb_per_s) not in (int, float) or self.archive_throttle_mb_per_s < 0:
+                        print(f"Invalid archive_throttle_mb_per_s {self.archive_throttle_mb_per_s!r}, using unlimited.")
+                        self.archive_throttle_mb_per_s = 0
 
             except Exception as e:
                 print(f"Error loading config: {e}")
@@ -303,8 +1027,20 @@ class VideoManagerApp:
         
         data = {
             'last_folder': self.current_folder,
-            'tag_data': self.tag_data # Save the dictionary
+            'tag_data': self.tag_data, # Save the dictionary
+            'tag_rules': self.tag_rules,
+            'auto_tag_on_ingest': self.auto_tag_on_ingest,
+            'group_by_session': self.group_by_session,
+            'session_gap_minutes': self.session_gap_minutes,
+            'player_command': self.player.command,
+            'player_enqueue_command': self.player.enqueue_command,
+            'retention_rules': self.retention_rules,
+            'archive_folder': self.archive_folder,
+            'archive_workers': self.archive_workers,
+            'archive_throttle_mb_per_s': self.archive_throttle_mb_per_s
         }
+        # Rules validate their tags against tag_data, so recompile on next use
+        self.compiled_tag_rules = None
         with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=4)
 
@@ -322,26 +1058,32 @@ class VideoManagerApp:
         
         self.file_listbox.delete(0, tk.END)
         self.video_files = []
+        self.list_rows = []
         
         try:
-            files = os.listdir(self.current_folder)
-            files = [f for f in files if f.lower().endswith('.mp4')]
-            
-            # --- Custom Sort Logic ---
-            def custom_sort_key(filename):
-                match = re.match(r"(.+ \d{4}\.\d{2}\.\d{2}) - (\d+).*\.mp4$", filename, re.IGNORECASE)
-                if match:
-                    prefix = match.group(1).lower()
-                    index = int(match.group(2))
-                    return (prefix, -index)
-                return (filename.lower(), 0)
-
-            files.sort(key=custom_sort_key, reverse=True) 
-            # -------------------------
-            
-            for f in files:
-                self.file_listbox.insert(tk.END, f)
-                self.video_files.append(f)
+            if self.group_by_session:
+                self.sync_folder_index()
+                self.render_session_list()
+            else:
+                files = os.listdir(self.current_folder)
+                files = [f for f in files if f.lower().endswith('.mp4') and not self.is_pending(f)]
+                
+                # --- Custom Sort Logic ---
+                def custom_sort_key(filename):
+                    match = re.match(r"(.+ \d{4}\.\d{2}\.\d{2}) - (\d+).*\.mp4$", filename, re.IGNORECASE)
+                    if match:
+                        prefix = match.group(1).lower()
+                        index = int(match.group(2))
+                        return (prefix, -index)
+                    return (filename.lower(), 0)
+
+                files.sort(key=custom_sort_key, reverse=True) 
+                # -------------------------
+                
+                for f in files:
+                    self.file_listbox.insert(tk.END, f)
+                    self.video_files.append(f)
+                    self.list_rows.append(f)
                 
             self.current_file_label.config(text="Select a video from the list...")
             self.preview_entry.delete(0, tk.END)
@@ -358,8 +1100,10 @@ class VideoManagerApp:
 
         files = [f for f in os.listdir(self.current_folder) if f.lower().endswith('.mp4')]
         
-        pattern = re.compile(r"(.+ \d{4}\.\d{2}\.\d{2}) - .*DVR.*\.mp4", re.IGNORECASE)
+        # Group 2 keeps any tag suffix added to the raw name (e.g. by auto-tag rules)
+        pattern = re.compile(r"(.+ \d{4}\.\d{2}\.\d{2}) - .*DVR(.*)\.mp4", re.IGNORECASE)
         groups = {}
+        suffixes = {}
         
         for f in files:
             match = pattern.match(f)
@@ -368,26 +1112,39 @@ class VideoManagerApp:
                 if date_prefix not in groups:
                     groups[date_prefix] = []
                 groups[date_prefix].append(f)
+                suffixes[f] = match.group(2)
+        
+        # Continue after the highest index already used for each date (e.g. by
+        # "Format session"), so existing clips are never collided with
+        last_index = {}
+        for f in files:
+            clip = ClipInfo(self.current_folder, f, 0, 0)
+            if clip.kind == "formatted":
+                prefix = f"{clip.game} {clip.date}"
+                last_index[prefix] = max(last_index.get(prefix, 0), int(clip.core))
         
         count = 0
+        errors = []
         for prefix, file_list in groups.items():
             file_list.sort(key=lambda x: os.path.getmtime(os.path.join(self.current_folder, x)))
             
-            for idx, filename in enumerate(file_list):
+            for filename in file_list:
+                last_index[prefix] = last_index.get(prefix, 0) + 1
                 old_path = os.path.join(self.current_folder, filename)
-                new_name = f"{prefix} - {idx + 1}.mp4"
+                new_name = f"{prefix} - {last_index[prefix]}{suffixes[filename]}.mp4"
                 new_path = os.path.join(self.current_folder, new_name)
                 
-                if filename != new_name:
-                    while os.path.exists(new_path):
-                         break 
-                    else:
-                        try:
-                            os.rename(old_path, new_path)
-                            count += 1
-                        except OSError as e:
-                            print(f"Error renaming {filename}: {e}")
-
+                if os.path.exists(new_path):
+                    errors.append(f"{filename}: '{new_name}' already exists")
+                    continue
+                try:
+                    os.rename(old_path, new_path)
+                    count += 1
+                except OSError as e:
+                    errors.append(f"{filename}: {e}")
+
+        if errors:
+            messagebox.showerror("Error", f"Could not format {len(errors)} files:\n\n" + "\n".join(errors[:15]))
         messagebox.showinfo("Done", f"Formatted {count} video files.")
         self.refresh_file_list()
 
@@ -397,7 +1154,7 @@ class VideoManagerApp:
             
         files = [f for f in os.listdir(self.current_folder) if f.lower().endswith('.mp4')]
         replaced_count = 0
-        trim_pattern = re.compile(r"(.+?)(?:[\s_-]+Trim)\.mp4$", re.IGNORECASE)
+        trim_pattern = TRIM_PATTERN
         
         for filename in files:
             match = trim_pattern.match(filename)
@@ -620,7 +1377,9 @@ class VideoManagerApp:
     def on_file_select(self, event):
         selection = self.file_listbox.curselection()
         if selection:
-            filename = self.file_listbox.get(selection[0])
+            filename = self.row_filename(selection[0])
+            if filename is None:
+                return
             self.current_file_label.config(text=filename)
             
             for var in self.selected_tags_vars.values():
@@ -638,12 +1397,12 @@ class VideoManagerApp:
 
     def update_preview_name(self):
         selection = self.file_listbox.curselection()
-        if not selection:
+        if not selection or self.row_filename(selection[0]) is None:
             self.preview_entry.delete(0, tk.END)
             self.preview_entry.insert(0, "...")
             return
             
-        original_name = self.file_listbox.get(selection[0])
+        original_name = self.row_filename(selection[0])
         base, ext = os.path.splitext(original_name)
         
         match = re.match(r"(.+ \d{4}\.\d{2}\.\d{2} - \d+)", base)
@@ -666,10 +1425,10 @@ class VideoManagerApp:
 
     def apply_rename(self):
         selection = self.file_listbox.curselection()
-        if not selection:
+        if not selection or self.row_filename(selection[0]) is None:
             return
             
-        old_name = self.file_listbox.get(selection[0])
+        old_name = self.row_filename(selection[0])
         new_name = self.preview_entry.get().strip()
         
         if not new_name:
@@ -684,9 +1443,12 @@ class VideoManagerApp:
         
         try:
             os.rename(old_path, new_path)
+            if self.folder_index:
+                self.folder_index.rename(old_name, new_name)
             index = selection[0]
             self.file_listbox.delete(index)
-            self.file_listbox.insert(index, new_name)
+            self.file_listbox.insert(index, self.row_text(new_name))
+            self.list_rows[index] = new_name
             self.file_listbox.selection_set(index)
             self.current_file_label.config(text=new_name)
         except OSError as e:
@@ -694,91 +1456,867 @@ class VideoManagerApp:
 
     def open_video(self):
         selection = self.file_listbox.curselection()
-        if not selection:
+        if not selection or self.row_filename(selection[0]) is None:
             return
-        filename = self.file_listbox.get(selection[0])
+        filename = self.row_filename(selection[0])
         filepath = os.path.join(self.current_folder, filename)
         
-        if platform.system() == 'Windows':
-            os.startfile(filepath)
-        elif platform.system() == 'Darwin': 
-            subprocess.call(('open', filepath))
-        else: 
-            subprocess.call(('xdg-open', filepath))
+        # The clip below (skipping session headers) can be queued by a custom player command
+        next_path = None
+        for index in range(selection[0] + 1, len(self.list_rows)):
+            if self.row_filename(index) is not None:
+                next_path = os.path.join(self.current_folder, self.row_filename(index))
+                break
+        
+        try:
+            self.player.open(filepath, next_path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Could not start the player:\n{e}")
 
-    def delete_to_recycle_bin(self, event):
-        """Delete key: Send to Recycle Bin"""
-        if send2trash is None:
-            messagebox.showerror("Missing Library", "Please run 'pip install send2trash' to use the Recycle Bin feature.")
+    # ---------------- Session Grouping ----------------
+
+    def row_filename(self, index):
+        """Filename shown in a list row, or None for session header rows"""
+        row = self.list_rows[index]
+        return row if isinstance(row, str) else None
+
+    def row_text(self, filename):
+        """Clip rows are indented under their session header when grouping"""
+        return f"    {filename}" if self.group_by_session else filename
+
+    def on_group_toggle(self):
+        self.group_by_session = self.group_var.get()
+        self.save_config()
+        self.refresh_file_list()
+
+    def render_session_list(self):
+        """Rebuild the list as session groups, keeping the selection and scroll position"""
+        selected = {self.row_filename(i) for i in self.file_listbox.curselection()}
+        top = self.file_listbox.yview()[0]
+
+        self.file_listbox.delete(0, tk.END)
+        self.video_files = []
+        self.list_rows = []
+
+        for session in self.session_index.sessions():
+            names = [clip.name for clip in reversed(session.clips) if not self.is_pending(clip.name)]
+            if not names:
+                continue
+            collapsed = session.key in self.collapsed_sessions
+            self.file_listbox.insert(tk.END, f"{'▶' if collapsed else '▼'} {session.label()}")
+            self.file_listbox.itemconfig(tk.END, bg="#f0f2f5", fg="#0078d4")
+            self.list_rows.append(session)
+            if not collapsed:
+                for name in names:
+                    self.file_listbox.insert(tk.END, self.row_text(name))
+                    self.list_rows.append(name)
+            self.video_files.extend(names)
+
+        # Files without a "Game YYYY.MM.DD" prefix cannot be grouped
+        others = sorted(name for name, clip in self.folder_index.clips.items()
+                        if clip.kind == "other" and not self.is_pending(name))
+        for name in others:
+            self.file_listbox.insert(tk.END, name)
+            self.list_rows.append(name)
+            self.video_files.append(name)
+
+        for index, row in enumerate(self.list_rows):
+            if isinstance(row, str) and row in selected:
+                self.file_listbox.selection_set(index)
+        self.file_listbox.yview_moveto(top)
+
+    def on_list_double_click(self, event):
+        """Double click opens a clip, or collapses/expands a session header"""
+        index = self.file_listbox.nearest(event.y)
+        if index < len(self.list_rows) and isinstance(self.list_rows[index], Session):
+            self.toggle_session(self.list_rows[index])
+            return 'break'
+        self.open_video()
+
+    def toggle_session(self, session):
+        self.collapsed_sessions ^= {session.key}
+        self.render_session_list()
+
+    def show_session_menu(self, event):
+        """Right-click on a session header: per-session actions"""
+        index = self.file_listbox.nearest(event.y)
+        if index >= len(self.list_rows) or not isinstance(self.list_rows[index], Session):
             return
+        session = self.list_rows[index]
+        collapsed = session.key in self.collapsed_sessions
 
-        selection = self.file_listbox.curselection()
-        if not selection:
+        menu = tk.Menu(self.root, tearoff=0)
+        menu.add_command(label="▼ Expand" if collapsed else "▶ Collapse", command=lambda: self.toggle_session(session))
+        menu.add_separator()
+        menu.add_command(label="⚠️ Format session (DVR -> Index)", command=lambda: self.format_session(session))
+        menu.add_command(label="🏷️ Add checked tags to session", command=lambda: self.tag_session(session))
+        menu.add_command(label="📤 Export session to folder...", command=lambda: self.export_session(session))
+        menu.post(event.x_root, event.y_root)
+
+    def rename_clips(self, renames):
+        """Rename (ClipInfo, new_name) pairs; returns (count, error lines)"""
+        count = 0
+        errors = []
+        for clip, new_name in renames:
+            if self.is_pending(clip.name):
+                continue
+            new_path = os.path.join(self.current_folder, new_name)
+            if os.path.exists(new_path):
+                errors.append(f"{clip.name}: '{new_name}' already exists")
+                continue
+            try:
+                os.rename(clip.path, new_path)
+                self.folder_index.rename(clip.name, new_name)
+                count += 1
+            except OSError as e:
+                errors.append(f"{clip.name}: {e}")
+        return count, errors
+
+    def finish_session_renames(self, action, count, errors):
+        if errors:
+            messagebox.showerror("Error", f"{action} failed for {len(errors)} files:\n\n" + "\n".join(errors[:15]))
+        messagebox.showinfo("Done", f"{action}: renamed {count} video files.")
+        self.refresh_file_list()
+
+    def format_session(self, session):
+        """Give the raw DVR clips of one session the next free indices for their date.
+
+        Batch Format continues from the highest index too, so formatting sessions
+        out of time order never collides with it."""
+        last_index = {}
+        for clip in self.folder_index.clips.values():
+            if clip.kind == "formatted":
+                key = (clip.game, clip.date)
+                last_index[key] = max(last_index.get(key, 0), int(clip.core))
+
+        renames = []
+        for clip in session.clips:
+            if clip.kind != "raw":
+                continue
+            key = (clip.game, clip.date)
+            last_index[key] = last_index.get(key, 0) + 1
+            renames.append((clip, clip.name_with_tags(clip.tags, core=str(last_index[key]))))
+
+        count, errors = self.rename_clips(renames)
+        self.finish_session_renames("Format session", count, errors)
+
+    def tag_session(self, session):
+        """Add the currently checked tags to every clip in the session"""
+        checked = [tag for tag, var in self.selected_tags_vars.items() if var.get()]
+        if not checked:
+            messagebox.showinfo("Info", "Check the tags to add first.")
             return
 
-        index = selection[0]
-        filename = self.file_listbox.get(index)
-        filepath = os.path.join(self.current_folder, filename)
+        # The checked tags come from the current category; only use the session game's own (and General)
+        allowed = set(self.tag_data.get(session.game, [])) | set(self.tag_data.get("General", []))
+        active_tags = [tag for tag in checked if tag in allowed]
+        skipped = [tag for tag in checked if tag not in allowed]
+        if not active_tags:
+            messagebox.showinfo("Info", f"None of the checked tags belong to {session.game} or General.")
+            return
+        if skipped and not messagebox.askyesno("Tag Session", f"Not {session.game} tags, skipped: {', '.join(skipped)}\n\n"
+                                               f"Add {', '.join(active_tags)} to the session?"):
+            return
+
+        renames = []
+        for clip in session.clips:
+            tags = clip.tags + [t for t in active_tags if t not in clip.tags]
+            if len(tags) != len(clip.tags):
+                renames.append((clip, clip.name_with_tags(tags)))
+
+        count, errors = self.rename_clips(renames)
+        self.finish_session_renames("Tag session", count, errors)
+
+    def export_session(self, session):
+        """Copy the session's clips to another folder in the background"""
+        target = filedialog.askdirectory(title="Export session to...")
+        if not target:
+            return
+        folder = self.current_folder
+        # Files a delete job is removing are not exported
+        names = [clip.name for clip in session.clips if not self.is_pending(clip.name)]
+
+        def export(name):
+            dest = os.path.join(target, name)
+            if os.path.exists(dest):
+                raise FileExistsError(f"'{dest}' already exists")
+            shutil.copy2(os.path.join(folder, name), dest)
+
+        # Own lane: multi-GB copies must not hold up user deletes
+        self.submit_file_job("Export session", export, names, hide=False, notify=True, lane="export")
+
+    # ---------------- Folder Statistics ----------------
+
+    def open_stats_window(self):
+        """Counts and disk usage per game, date, tag and format status"""
+        if not self.current_folder:
+            return
+        if self.stats_window:
+            self.stats_window.lift()
+            self.render_stats()
+            return
+
+        win = tk.Toplevel(self.root)
+        win.title("Folder Statistics")
+        win.geometry("560x520")
+        win.configure(bg="#ffffff")
+        self.stats_window = win
+
+        def on_close():
+            self.stats_window = None
+            win.destroy()
+        win.protocol("WM_DELETE_WINDOW", on_close)
+
+        self.stats_summary = ttk.Label(win, text="", style="Card.TLabel")
+        self.stats_summary.pack(anchor=tk.W, padx=10, pady=10)
+
+        tree_frame = tk.Frame(win, bg="white")
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=10)
+        scrollbar = ttk.Scrollbar(tree_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.stats_tree = ttk.Treeview(tree_frame, columns=("clips", "size"), yscrollcommand=scrollbar.set)
+        self.stats_tree.heading("#0", text="Name", anchor=tk.W)
+        self.stats_tree.heading("clips", text="Clips")
+        self.stats_tree.heading("size", text="Size")
+        self.stats_tree.column("clips", width=80, anchor=tk.E)
+        self.stats_tree.column("size", width=110, anchor=tk.E)
+        self.stats_tree.pack(fill=tk.BOTH, expand=True)
+        scrollbar.config(command=self.stats_tree.yview)
+
+        ttk.Button(win, text="🔄 Refresh", command=self.render_stats).pack(anchor=tk.E, padx=10, pady=10)
+        self.render_stats()
+
+    def render_stats(self, rescan=True):
+        """Redraw from the incrementally maintained totals (rescan only picks up changes)"""
+        if rescan:
+            try:
+                self.sync_folder_index()
+            except OSError as e:
+                messagebox.showerror("Error", f"Cannot read folder: {e}", parent=self.stats_window)
+                return
+
+        open_sections = {self.stats_tree.item(item, "text") for item in self.stats_tree.get_children()
+                         if self.stats_tree.item(item, "open")}
+        self.stats_tree.delete(*self.stats_tree.get_children())
+        self.stats_summary.config(text=f"{self.current_folder}\n{self.folder_stats.summary()}")
+
+        for title, rows in self.folder_stats.sections():
+            section = self.stats_tree.insert("", tk.END, text=title, open=title in open_sections or title == "Games",
+                                             values=(len(rows), ""))
+            for name, count, size in rows:
+                self.stats_tree.insert(section, tk.END, text=name, values=(count, format_bytes(size)))
+
+    # ---------------- Retention / Archiving ----------------
+
+    def open_retention_editor(self):
+        """Edit retention policies and the archive folder; dry run before anything moves"""
+        win = tk.Toplevel(self.root)
+        win.title("Retention Policies")
+        win.geometry("680x520")
+        win.configure(bg="#ffffff")
+
+        folder_row = ttk.Frame(win, style="Card.TFrame")
+        folder_row.pack(fill=tk.X, padx=10, pady=(10, 5))
+        ttk.Label(folder_row, text="🗄️ Archive folder:", style="Card.TLabel").pack(side=tk.LEFT)
+        archive_entry = ttk.Entry(folder_row, font=("Arial", 11))
+        archive_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        archive_entry.insert(0, self.archive_folder)
+
+        def browse():
+            folder = filedialog.askdirectory(parent=win)
+            if folder:
+                archive_entry.delete(0, tk.END)
+                archive_entry.insert(0, folder)
+        ttk.Button(folder_row, text="📂", command=browse, width=3).pack(side=tk.LEFT)
+
+        ttk.Label(win, text="Rules (JSON list). The first rule matching a clip decides:", style="Card.TLabel").pack(anchor=tk.W, padx=10)
+        ttk.Label(win, text='{"tags": ["ace", "clutch"], "keep": true}\n'
+                            '{"untagged": true, "archive_after_days": 14, "trash_after_days": 60}',
+                  style="Hint.TLabel").pack(anchor=tk.W, padx=10, pady=(2, 5))
+
+        text = tk.Text(win, font=("Consolas", 10), height=14, bd=1, relief="solid")
+        text.pack(fill=tk.BOTH, expand=True, padx=10)
+        text.insert("1.0", json.dumps(self.retention_rules, ensure_ascii=False, indent=4))
+
+        def save():
+            try:
+                rules = json.loads(text.get("1.0", tk.END))
+                compile_retention_rules(rules)
+            except ValueError as e:
+                messagebox.showerror("Retention Policies", f"Invalid rules:\n{e}", parent=win)
+                return False
+            archive_folder = archive_entry.get().strip()
+            if self.is_recording_folder(archive_folder):
+                messagebox.showerror("Retention Policies", "The archive folder must not be the recording folder.", parent=win)
+                return False
+            self.retention_rules = rules
+            self.archive_folder = archive_folder
+            self.save_config()
+            return True
+
+        def save_and_dry_run():
+            if save():
+                self.retention_dry_run()
+
+        btn_row = ttk.Frame(win, style="Card.TFrame")
+        btn_row.pack(fill=tk.X, padx=10, pady=10)
+        ttk.Button(btn_row, text="💾 Save", command=lambda: save() and win.destroy(), style="Success.TButton").pack(side=tk.RIGHT, padx=5)
+        ttk.Button(btn_row, text="🔍 Save & Dry Run", command=save_and_dry_run, style="Primary.TButton").pack(side=tk.RIGHT, padx=5)
+
+    def is_recording_folder(self, folder):
+        """True if folder is the current recording folder (under any spelling of its path)"""
+        if not folder or not self.current_folder:
+            return False
+        try:
+            return os.path.samefile(folder, self.current_folder)
+        except OSError:
+            return False
+
+    def archive_folder_ok(self):
+        """The archive folder is set, exists and is not the recording folder itself"""
+        return (bool(self.archive_folder) and os.path.isdir(self.archive_folder)
+                and not self.is_recording_folder(self.archive_folder))
+
+    def plan_retention_jobs(self):
+        """Evaluate the policies against the folder index (and the archive folder's)"""
+        rules = compile_retention_rules(self.retention_rules)
+        now = time.time()
+
+        self.sync_folder_index()
+        clips = [clip for name, clip in self.folder_index.clips.items() if not self.is_pending(name)]
+        plan = plan_retention(clips, rules, now)
+
+        archived_plan = []
+        if self.archive_folder_ok():
+            if self.archive_index is None or self.archive_index.folder != self.archive_folder:
+                self.archive_index = FolderIndex(self.archive_folder)
+            self.archive_index.scan()
+            archived_plan = plan_retention(self.archive_index.clips.values(), rules, now, archived=True)
+        return plan, archived_plan
+
+    def retention_dry_run(self):
+        """Show what the policies would do and how many bytes that frees, then offer to run"""
+        if not self.current_folder:
+            return
+        try:
+            plan, archived_plan = self.plan_retention_jobs()
+        except ValueError as e:
+            messagebox.showerror("Retention Policies", f"Invalid rules:\n{e}")
+            return
+        except OSError as e:
+            messagebox.showerror("Error", f"Cannot read folder: {e}")
+            return
+
+        to_archive = [clip for clip, action in plan if action == "archive"]
+        to_trash = [clip for clip, action in plan if action == "trash"]
+        archive_bytes = sum(clip.size for clip in to_archive)
+        trash_bytes = sum(clip.size for clip in to_trash)
+        archived_trash_bytes = sum(clip.size for clip, action in archived_plan)
+
+        lines = [
+            f"Recording folder: {format_bytes(archive_bytes + trash_bytes)} would be reclaimed",
+            f"  Move to archive: {len(to_archive)} clips, {format_bytes(archive_bytes)}",
+            f"  Move to trash:   {len(to_trash)} clips, {format_bytes(trash_bytes)}",
+            f"Archive folder: {len(archived_plan)} clips to trash, {format_bytes(archived_trash_bytes)}",
+        ]
+        trims = sum(1 for clip in self.folder_index.clips.values() if clip.is_trim)
+        if trims:
+            lines.append(f"Left alone: {trims} Trim files waiting for Replace Trimmed")
+        if to_archive and not self.archive_folder_ok():
+            lines.append("\n⚠️ Archive folder is not set, does not exist or is the recording folder; archiving will be skipped.")
+        if (to_trash or archived_plan) and send2trash is None:
+            lines.append("\n⚠️ 'send2trash' is not installed; trashing will be skipped.")
+        lines.append("")
+        for clip, action in plan:
+            lines.append(f"[{action}] {clip.name}  ({format_bytes(clip.size)})")
+        for clip, action in archived_plan:
+            lines.append(f"[{action}] archive/{clip.name}  ({format_bytes(clip.size)})")
+
+        win = tk.Toplevel(self.root)
+        win.title("Retention Dry Run")
+        win.geometry("680x480")
+        win.configure(bg="#ffffff")
+        report = tk.Text(win, font=("Consolas", 10), bd=1, relief="solid")
+        report.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 0))
+        report.insert("1.0", "\n".join(lines))
+        report.config(state=tk.DISABLED)
+
+        def run():
+            win.destroy()
+            self.run_retention(plan, archived_plan)
+
+        btn_row = ttk.Frame(win, style="Card.TFrame")
+        btn_row.pack(fill=tk.X, padx=10, pady=10)
+        ttk.Button(btn_row, text="Close", command=win.destroy).pack(side=tk.RIGHT, padx=5)
+        if plan or archived_plan:
+            ttk.Button(btn_row, text="▶ Run Now", command=run, style="Danger.TButton").pack(side=tk.RIGHT, padx=5)
+
+    def run_retention(self, plan, archived_plan):
+        """Hand the moves to the background worker: parallel, throttled across drives"""
+        archive_ok = self.archive_folder_ok()
+        actions = {clip.name: action for clip, action in plan
+                   if (action == "archive" and archive_ok) or (action == "trash" and send2trash)}
+        folder = self.current_folder
+        archive_folder = self.archive_folder
+        throttle = Throttle(self.archive_throttle_mb_per_s * 1024 * 1024)
+
+        def apply(name):
+            path = os.path.join(folder, name)
+            if actions[name] == "archive":
+                move_file(path, archive_folder, throttle)
+            else:
+                send2trash(path)
 
-        if not messagebox.askyesno("Move to Trash", f"Move '{filename}' to Recycle Bin?"):
+        if actions:
+            self.submit_file_job("Retention", apply, list(actions), notify=True,
+                                 workers=self.archive_workers, lane="retention")
+            self.refresh_file_list()
+        if archived_plan and send2trash and archive_ok:
+            self.submit_file_job("Trash archived clips", lambda name: send2trash(os.path.join(archive_folder, name)),
+                                 [clip.name for clip, action in archived_plan], hide=False, notify=True, lane="retention")
+
+    # ---------------- Auto-Tag Rules ----------------
+
+    def get_compiled_tag_rules(self):
+        """Compile the configured rules once; shows an error and returns [] if invalid"""
+        if self.compiled_tag_rules is None:
+            try:
+                self.compiled_tag_rules = compile_tag_rules(self.tag_rules, self.tag_data)
+            except ValueError as e:
+                messagebox.showerror("Auto-Tag Rules", f"Invalid rule:\n{e}")
+                self.compiled_tag_rules = []
+        return self.compiled_tag_rules
+
+    def sync_folder_index(self, listing=None):
+        """Rescan the current folder (or apply a listing made elsewhere); returns (added, changed, removed)"""
+        if listing is None:
+            listing = FolderIndex.list_folder(self.current_folder)
+
+        if self.folder_index is None or self.folder_index.folder != self.current_folder:
+            self.folder_index = FolderIndex(self.current_folder)
+            self.session_index = SessionIndex(self.session_gap_minutes * 60)
+            self.folder_stats = FolderStats()
+            self.folder_index.listeners.extend([self.session_index, self.folder_stats])
+            self.ingest_pending = {}
+            # First scan of a folder only fills the cache; existing clips are not "new"
+            self.folder_index.apply_listing(listing)
+            return [], [], []
+
+        added, changed, removed = self.folder_index.apply_listing(listing)
+        now = time.monotonic()
+        for clip in added + changed:
+            self.ingest_pending[clip.name] = (clip, now)
+        return added, changed, removed
+
+    def run_auto_tag(self, clips):
+        """Rename every clip the rules add tags to; returns (count, error lines)"""
+        rules = self.get_compiled_tag_rules()
+        return self.rename_clips(list(plan_auto_tags(clips, rules)))
+
+    def auto_tag_folder(self):
+        """Batch pass: apply the rules to every clip in the folder.
+
+        The listing and the rule checks (including mp4 duration reads) run on a
+        worker thread; finish_auto_tag_folder does the renames on the Tk thread.
+        """
+        if not self.current_folder or self.auto_tag_busy:
             return
+        rules = self.get_compiled_tag_rules()
+        folder = self.current_folder
+        # Reuse cached ClipInfo (and durations already read) for unchanged files
+        cached = dict(self.folder_index.clips) if self.folder_index and self.folder_index.folder == folder else {}
+        self.auto_tag_busy = True
 
+        def work():
+            try:
+                listing = FolderIndex.list_folder(folder)
+            except OSError as e:
+                self.auto_tag_results.put((folder, None, [], e))
+                return
+            clips = []
+            for name, (size, mtime) in listing.items():
+                clip = cached.get(name)
+                if not clip or clip.size != size or clip.mtime != mtime:
+                    clip = ClipInfo(folder, name, size, mtime)
+                clips.append(clip)
+            clips.sort(key=lambda c: c.mtime)
+            self.auto_tag_results.put((folder, listing, list(plan_auto_tags(clips, rules)), None))
+
+        threading.Thread(target=work, daemon=True).start()
+        self.root.after(JOB_POLL_MS, self.finish_auto_tag_folder)
+
+    def finish_auto_tag_folder(self):
+        """Tk thread: apply the planned renames of a batch auto-tag pass"""
         try:
-            send2trash(filepath)
-            # Update UI
+            folder, listing, plan, error = self.auto_tag_results.get_nowait()
+        except queue.Empty:
+            self.root.after(JOB_POLL_MS, self.finish_auto_tag_folder)
+            return
+        self.auto_tag_busy = False
+        if error:
+            messagebox.showerror("Error", f"Cannot read folder: {error}")
+            return
+        if folder != self.current_folder:
+            return
+
+        self.sync_folder_index(listing)
+        # Skip clips that were renamed, removed or rewritten while the plan was made
+        renames = []
+        for clip, new_name in plan:
+            current = self.folder_index.clips.get(clip.name)
+            if current and current.size == clip.size and current.mtime == clip.mtime:
+                renames.append((current, new_name))
+        count, errors = self.rename_clips(renames)
+        if errors:
+            messagebox.showerror("Error", f"Auto-tag failed for {len(errors)} files:\n\n" + "\n".join(errors[:15]))
+        messagebox.showinfo("Done", f"Auto-tagged {count} video files.")
+        if count:
+            self.refresh_file_list()
+
+    def watch_folder(self):
+        """Periodic rescan for the features that follow the folder (ingest, sessions, stats).
+
+        The directory listing and any mp4 duration reads run on a short-lived
+        thread so slow (network) drives never stall the window; the results
+        are applied on the Tk thread by finish_watch.
+        """
+        self.root.after(WATCH_INTERVAL_MS, self.watch_folder)
+        self.player.reap()
+        if not self.current_folder or self.watch_busy:
+            return
+        if not self.auto_tag_on_ingest:
+            self.ingest_pending = {}
+            if not self.group_by_session and not self.stats_window:
+                return
+
+        # Clips unchanged for a full interval are ready to tag. Their durations are
+        # read on the watch thread too; finish_watch checks they did not change again.
+        settled = []
+        if self.auto_tag_on_ingest and self.folder_index:
+            now = time.monotonic()
+            for name, (clip, seen_at) in list(self.ingest_pending.items()):
+                if self.folder_index.clips.get(name) is not clip:
+                    del self.ingest_pending[name]  # Gone or renamed since
+                elif now - seen_at >= WATCH_INTERVAL_MS / 1000:
+                    del self.ingest_pending[name]
+                    settled.append(clip)
+        read_durations = settled and any(rule.needs_duration for rule in self.get_compiled_tag_rules())
+
+        folder = self.current_folder
+        self.watch_busy = True
+
+        def work():
+            try:
+                listing = FolderIndex.list_folder(folder)
+            except OSError:
+                listing = None
+            if read_durations:
+                for clip in settled:
+                    clip.duration
+            self.watch_results.put((folder, listing, settled))
+
+        threading.Thread(target=work, daemon=True).start()
+        self.root.after(JOB_POLL_MS, self.finish_watch)
+
+    def finish_watch(self):
+        """Apply a finished watch scan on the Tk thread"""
+        try:
+            folder, listing, settled = self.watch_results.get_nowait()
+        except queue.Empty:
+            self.root.after(JOB_POLL_MS, self.finish_watch)
+            return
+        self.watch_busy = False
+        if listing is None or folder != self.current_folder:
+            return
+
+        stats = self.folder_stats
+        added, changed, removed = self.sync_folder_index(listing)
+        # A new folder gets a fresh index that reports no changes, but its totals differ
+        rebuilt = self.folder_stats is not stats
+
+        renamed = 0
+        settled = [clip for clip in settled if self.folder_index.clips.get(clip.name) is clip]
+        if self.auto_tag_on_ingest and settled:
+            renamed, errors = self.run_auto_tag(settled)
+            if errors:
+                if not self.ingest_errors:
+                    self.root.after_idle(self.show_ingest_errors)
+                self.ingest_errors.extend(errors)
+
+        if self.group_by_session and (renamed or added or changed or removed):
+            # Sessions were updated incrementally by the index; just redraw
+            self.render_session_list()
+        elif renamed:
+            self.refresh_file_list()
+
+        if self.stats_window and (rebuilt or renamed or added or changed or removed):
+            self.render_stats(rescan=False)
+
+    def show_ingest_errors(self):
+        """One dialog for all auto-tag failures collected while ingesting"""
+        errors, self.ingest_errors = self.ingest_errors, []
+        lines = errors[:15]
+        if len(errors) > 15:
+            lines.append(f"...and {len(errors) - 15} more")
+        messagebox.showerror("Auto-Tag", f"Auto-tagging new clips failed for {len(errors)} files:\n\n" + "\n".join(lines))
+
+    def open_rules_editor(self):
+        """Edit the auto-tag rules (JSON list) in a small dialog"""
+        win = tk.Toplevel(self.root)
+        win.title("Auto-Tag Rules")
+        win.geometry("640x480")
+        win.configure(bg="#ffffff")
+
+        ttk.Label(win, text="Rules (JSON list). Every condition given must match:", style="Card.TLabel").pack(anchor=tk.W, padx=10, pady=(10, 0))
+        ttk.Label(win, text='{"name": "Night aces", "game": "Valorant", "tags": ["ace"], "hours": [18, 23],\n'
+                            ' "min_duration": 30, "max_duration": 120, "min_size_mb": 10, "max_size_mb": 500}',
+                  style="Hint.TLabel").pack(anchor=tk.W, padx=10, pady=(2, 5))
+
+        text = tk.Text(win, font=("Consolas", 10), height=16, bd=1, relief="solid")
+        text.pack(fill=tk.BOTH, expand=True, padx=10)
+        text.insert("1.0", json.dumps(self.tag_rules, ensure_ascii=False, indent=4))
+
+        ingest_var = tk.BooleanVar(value=self.auto_tag_on_ingest)
+        ttk.Checkbutton(win, text="Auto-tag new clips as they appear in the folder", variable=ingest_var).pack(anchor=tk.W, padx=10, pady=5)
+
+        def save():
+            try:
+                rules = json.loads(text.get("1.0", tk.END))
+                compile_tag_rules(rules, self.tag_data)
+            except ValueError as e:
+                messagebox.showerror("Auto-Tag Rules", f"Invalid rules:\n{e}", parent=win)
+                return False
+            self.tag_rules = rules
+            self.auto_tag_on_ingest = ingest_var.get()
+            self.save_config()
+            return True
+
+        def save_and_run():
+            if save():
+                self.auto_tag_folder()
+
+        btn_row = ttk.Frame(win, style="Card.TFrame")
+        btn_row.pack(fill=tk.X, padx=10, pady=(0, 10))
+        ttk.Button(btn_row, text="💾 Save", command=lambda: save() and win.destroy(), style="Success.TButton").pack(side=tk.RIGHT, padx=5)
+        ttk.Button(btn_row, text="▶ Save & Run on Folder", command=save_and_run, style="Primary.TButton").pack(side=tk.RIGHT, padx=5)
+
+    # ---------------- Background File Jobs ----------------
+
+    def submit_file_job(self, title, func, filenames, hide=True, notify=False, workers=1, lane="files"):
+        """Queue func(filename) for each file on a background worker thread.
+
+        hide: keep the files out of the list while the job runs (for removals)
+        notify: also report successful completion, not just failures
+        workers: run up to this many files of the job in parallel
+        lane: jobs in the same lane run one after another; lanes run independently
+        """
+        # Jobs remember their folder: the user may switch folders while one runs
+        folder = self.current_folder
+        if hide:
+            self.pending_files.update(os.path.join(folder, name) for name in filenames)
+        job_queue = self.job_queues.setdefault(lane, queue.Queue())
+        job_queue.put((title, func, list(filenames), folder, hide, notify, workers))
+        self.jobs_outstanding += 1
+
+        worker = self.job_workers.get(lane)
+        if worker is None or not worker.is_alive():
+            worker = threading.Thread(target=self.run_file_jobs, args=(job_queue,), daemon=True)
+            self.job_workers[lane] = worker
+            worker.start()
+
+        if self.jobs_outstanding == 1:
+            self.root.after(JOB_POLL_MS, self.poll_file_jobs)
+
+    def run_file_jobs(self, job_queue):
+        """Worker loop for one lane: runs its jobs one after another, collecting failures"""
+        while True:
+            title, func, filenames, folder, hide, notify, workers = job_queue.get()
+            failures = []
+
+            def run(filename):
+                try:
+                    func(filename)
+                except Exception as e:
+                    failures.append((filename, e))
+
+            # Always report back, or jobs_outstanding never drops and hidden rows stay hidden
+            try:
+                if workers > 1:
+                    with ThreadPoolExecutor(max_workers=workers) as pool:
+                        list(pool.map(run, filenames))
+                else:
+                    for filename in filenames:
+                        run(filename)
+            except Exception as e:
+                failures.append(("(job)", e))
+            self.job_results.put((title, filenames, failures, folder, hide, notify))
+
+    def poll_file_jobs(self):
+        """Runs on the Tk thread: report finished jobs, reschedule while busy"""
+        failed_here = False
+        while True:
+            try:
+                title, filenames, failures, folder, hide, notify = self.job_results.get_nowait()
+            except queue.Empty:
+                break
+
+            self.jobs_outstanding -= 1
+            if hide:
+                self.pending_files.difference_update(os.path.join(folder, name) for name in filenames)
+
+            if failures:
+                failed_here = failed_here or folder == self.current_folder
+                lines = [f"{name}: {err}" for name, err in failures[:15]]
+                if len(failures) > 15:
+                    lines.append(f"...and {len(failures) - 15} more")
+                messagebox.showerror("Error", f"{title} failed for {len(failures)} of {len(filenames)} files:\n\n" + "\n".join(lines))
+            elif notify:
+                messagebox.showinfo("Done", f"{title}: {len(filenames)} files finished.")
+
+        # Failed files are still on disk, so bring their rows back (if their folder is shown)
+        if failed_here:
+            self.refresh_file_list()
+
+        if self.jobs_outstanding > 0:
+            self.root.after(JOB_POLL_MS, self.poll_file_jobs)
+
+    def on_close(self):
+        """Ask before quitting while background jobs still run"""
+        if self.jobs_outstanding > 0 and not messagebox.askyesno(
+                "Jobs Running", f"{self.jobs_outstanding} background file job(s) are still running.\n"
+                                "Quitting now stops them part-way. Quit anyway?", icon='warning'):
+            return
+        self.root.destroy()
+
+    def is_pending(self, filename):
+        """True if a background job is removing this file of the current folder"""
+        return os.path.join(self.current_folder, filename) in self.pending_files
+
+    def remove_selected_rows(self):
+        """Drop the selected rows from the list right away and return their filenames"""
+        selection = self.selected_file_rows()
+        if not selection:
+            return []
+
+        filenames = [self.row_filename(i) for i in selection]
+        for index in reversed(selection):
             self.file_listbox.delete(index)
-            self.video_files.remove(filename)
-            self.current_file_label.config(text="Select a video...")
-            self.preview_entry.delete(0, tk.END)
-            
-            # Select the next item if available
-            if self.file_listbox.size() > index:
-                self.file_listbox.selection_set(index)
-                self.file_listbox.event_generate("<<ListboxSelect>>")
-            elif self.file_listbox.size() > 0:
-                self.file_listbox.selection_set(tk.END)
-                self.file_listbox.event_generate("<<ListboxSelect>>")
+            del self.list_rows[index]
+        for filename in filenames:
+            if filename in self.video_files:
+                self.video_files.remove(filename)
 
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not move to trash:\n{e}")
+        self.current_file_label.config(text="Select a video...")
+        self.preview_entry.delete(0, tk.END)
 
-    def delete_permanently(self, event):
-        """Shift+Delete: Permanently Remove"""
-        selection = self.file_listbox.curselection()
+        # Select the item that moved into the first deleted slot, if any
+        index = selection[0]
+        if self.file_listbox.size() > index:
+            self.file_listbox.selection_set(index)
+            self.file_listbox.event_generate("<<ListboxSelect>>")
+        elif self.file_listbox.size() > 0:
+            self.file_listbox.selection_set(tk.END)
+            self.file_listbox.event_generate("<<ListboxSelect>>")
+
+        return filenames
+
+    def selected_file_rows(self):
+        """Selected row indices, skipping session header rows"""
+        return [i for i in self.file_listbox.curselection() if self.row_filename(i) is not None]
+
+    def describe_selection(self, selection):
+        """'name.mp4' for one file, 'N files' for several"""
+        if len(selection) == 1:
+            return f"'{self.row_filename(selection[0])}'"
+        return f"{len(selection)} files"
+
+    def delete_to_recycle_bin(self, event):
+        """Delete key: Send selected files to Recycle Bin"""
+        if send2trash is None:
+            messagebox.showerror("Missing Library", "Please run 'pip install send2trash' to use the Recycle Bin feature.")
+            return
+
+        selection = self.selected_file_rows()
         if not selection:
             return
 
-        index = selection[0]
-        filename = self.file_listbox.get(index)
-        filepath = os.path.join(self.current_folder, filename)
+        if not messagebox.askyesno("Move to Trash", f"Move {self.describe_selection(selection)} to Recycle Bin?"):
+            return
+
+        folder = self.current_folder
+        filenames = self.remove_selected_rows()
+        self.submit_file_job("Move to trash", lambda name: send2trash(os.path.join(folder, name)), filenames)
+
+    def delete_permanently(self, event):
+        """Shift+Delete: Permanently remove selected files"""
+        selection = self.selected_file_rows()
+        if not selection:
+            return
 
         # STRONG Confirmation
-        if not messagebox.askyesno("Permanent Delete", f"⚠️ PERMANENTLY delete '{filename}'?\nThis cannot be undone!", icon='warning'):
+        if not messagebox.askyesno("Permanent Delete", f"⚠️ PERMANENTLY delete {self.describe_selection(selection)}?\nThis cannot be undone!", icon='warning'):
             return
 
-        try:
-            os.remove(filepath)
-            # Update UI
-            self.file_listbox.delete(index)
-            self.video_files.remove(filename)
-            self.current_file_label.config(text="Select a video...")
-            self.preview_entry.delete(0, tk.END)
-            
-            # Select the next item logic
-            if self.file_listbox.size() > index:
-                self.file_listbox.selection_set(index)
-                self.file_listbox.event_generate("<<ListboxSelect>>")
-            elif self.file_listbox.size() > 0:
-                self.file_listbox.selection_set(tk.END)
-                self.file_listbox.event_generate("<<ListboxSelect>>")
-                
-        except OSError as e:
-            messagebox.showerror("Error", f"Could not delete file:\n{e}")
+        folder = self.current_folder
+        filenames = self.remove_selected_rows()
+        self.submit_file_job("Permanent delete", lambda name: os.remove(os.path.join(folder, name)), filenames)
             
         # Return 'break' to prevent the standard Delete event from also firing
         return 'break'
 
+def print_folder_stats(folder, as_json=False, out=None):
+    """Headless --stats: one pass over the folder's metadata, printed as text or JSON"""
+    index = FolderIndex(folder)
+    stats = FolderStats()
+    index.listeners.append(stats)
+    index.scan()
+    print(json.dumps(stats.as_dict(), ensure_ascii=False, indent=4) if as_json else stats.report(), file=out)
+
+def run_headless_stats(args):
+    """--stats entry point. The --noconsole exe has no stdout/stderr, so --output
+    writes the report (or the error) to a file instead."""
+    try:
+        out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    except OSError as e:
+        print(f"Cannot write {args.output}: {e}", file=sys.stderr)
+        return 1
+    err = out if args.output else sys.stderr
+    try:
+        folder = args.stats
+        if not folder and os.path.exists(CONFIG_FILE):
+            try:
+                with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+                    folder = json.load(f).get('last_folder', "")
+            except (OSError, ValueError, AttributeError) as e:
+                print(f"Error loading config: {e}", file=err)
+                return 1
+        if not folder or not os.path.isdir(folder):
+            print("No folder given and no valid last folder in config.", file=err)
+            return 1
+        try:
+            print_folder_stats(folder, args.json, out)
+        except OSError as e:
+            print(f"Cannot read folder: {e}", file=err)
+            return 1
+        return 0
+    finally:
+        if args.output:
+            out.close()
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Instant Replay Name Manager")
+    parser.add_argument("--stats", nargs="?", const="", metavar="FOLDER",
+                        help="print folder statistics and exit (default: last used folder)")
+    parser.add_argument("--json", action="store_true", help="with --stats, print JSON")
+    parser.add_argument("--output", metavar="FILE", help="with --stats, write the report to FILE (needed for IRMN.exe)")
+    args = parser.parse_args()
+    if args.stats is None and (args.json or args.output):
+        parser.error("--json and --output require --stats")
+
+    if args.stats is not None:
+        sys.exit(run_headless_stats(args))
+
     root = tk.Tk()
     app = VideoManagerApp(root)
     root.mainloop()
\ No newline at end of file